@@ -3,9 +3,9 @@ Admin Routes
 """
 from fastapi import APIRouter, HTTPException, Request
 from datetime import datetime, timezone
-import uuid
 
 from ....core.database import db
+from ....core.ids import generate_uuid
 from ....core.security import get_current_user, get_user_role, serialize_doc
 from ....models.schemas import AdminCreate, SettleRevenueRequest
 from ....services.websocket import manager
@@ -63,7 +63,7 @@ async def add_admin(data: AdminCreate, request: Request):
         raise HTTPException(status_code=400, detail="Admin already exists")
     
     admin = {
-        "_id": str(uuid.uuid4()),
+        "_id": generate_uuid(),
         "email": data.email,
         "name": data.name or data.email.split("@")[0],
         "revenue": 0,
@@ -109,7 +109,7 @@ async def settle_admin_revenue(admin_id: str, data: SettleRevenueRequest, reques
     )
     
     settlement = {
-        "_id": str(uuid.uuid4()),
+        "_id": generate_uuid(),
         "admin_id": admin_id,
         "product_ids": data.product_ids,
         "amount": data.total_amount,
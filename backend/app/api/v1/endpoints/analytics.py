@@ -23,7 +23,9 @@ async def get_analytics_overview(request: Request, start_date: Optional[str] = N
     if end_date:
         date_filter["$lte"] = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
     
-    order_query = {}
+    # deleted_at keeps soft-deleted orders out of the numbers and lets the
+    # (deleted_at, created_at) compound index bound the date range scan
+    order_query = {"deleted_at": None}
     if date_filter:
         order_query["created_at"] = date_filter
     
@@ -4,10 +4,10 @@ Authentication Routes
 from fastapi import APIRouter, HTTPException, Response, Request
 from datetime import datetime, timezone, timedelta
 import httpx
-import uuid
 
 from ....core.database import db
-from ....core.security import get_current_user, get_user_role, get_session_token, serialize_doc
+from ....core.ids import generate_uuid
+from ....core.security import get_current_user, get_user_role, get_session_token, hash_session_token, serialize_doc
 from ....services.notification import notify_admins_new_user
 
 router = APIRouter(prefix="/auth")
@@ -36,7 +36,7 @@ async def exchange_session(request: Request, response: Response):
     if not user:
         is_new_user = True
         user = {
-            "_id": str(uuid.uuid4()),
+            "_id": generate_uuid(),
             "email": user_data["email"],
             "name": user_data["name"],
             "picture": user_data.get("picture"),
@@ -53,9 +53,10 @@ async def exchange_session(request: Request, response: Response):
         )
     
     session = {
-        "_id": str(uuid.uuid4()),
+        "_id": generate_uuid(),
         "user_id": user["_id"],
         "session_token": user_data["session_token"],
+        "token_hash": hash_session_token(user_data["session_token"]),
         "expires_at": datetime.now(timezone.utc) + timedelta(days=7),
         "created_at": datetime.now(timezone.utc),
     }
@@ -88,6 +89,8 @@ async def get_me(request: Request):
 async def logout(request: Request, response: Response):
     token = await get_session_token(request)
     if token:
-        await db.sessions.delete_one({"session_token": token})
+        await db.sessions.delete_one(
+            {"$or": [{"token_hash": hash_session_token(token)}, {"session_token": token}]}
+        )
     response.delete_cookie(key="session_token", path="/")
     return {"message": "Logged out"}
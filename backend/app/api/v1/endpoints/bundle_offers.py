@@ -83,7 +83,7 @@ async def update_bundle_offer(offer_id: str, data: BundleOfferCreate, request: R
     
     await db.bundle_offers.update_one(
         {"_id": offer_id},
-        {"$set": {**data.dict(), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": data.dict(), "$currentDate": {"updated_at": True}}
     )
     await manager.broadcast({"type": "sync", "tables": ["bundle_offers"]})
     return {"message": "Updated"}
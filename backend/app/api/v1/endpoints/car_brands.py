@@ -5,6 +5,7 @@ from fastapi import APIRouter
 from datetime import datetime, timezone
 import uuid
 
+from ....core.cache import lookup_cache
 from ....core.database import db
 from ....core.security import serialize_doc
 from ....models.schemas import CarBrandCreate
@@ -14,6 +15,9 @@ router = APIRouter(prefix="/car-brands")
 
 @router.get("")
 async def get_car_brands():
+    cached = lookup_cache.get("car_brands")
+    if cached is not None:
+        return cached
     brands = await db.car_brands.find({"deleted_at": None}).sort("name", 1).to_list(1000)
     result = []
     for b in brands:
@@ -22,6 +26,7 @@ async def get_car_brands():
             distributor = await db.distributors.find_one({"_id": b["distributor_id"]})
             b_data["distributor"] = serialize_doc(distributor) if distributor else None
         result.append(b_data)
+    lookup_cache.set("car_brands", result)
     return result
 
 @router.post("")
@@ -34,6 +39,7 @@ async def create_car_brand(brand: CarBrandCreate):
         "deleted_at": None
     }
     await db.car_brands.insert_one(doc)
+    lookup_cache.invalidate("car_brands")
     await manager.broadcast({"type": "sync", "tables": ["car_brands"]})
     return serialize_doc(doc)
 
@@ -41,7 +47,8 @@ async def create_car_brand(brand: CarBrandCreate):
 async def delete_car_brand(brand_id: str):
     await db.car_brands.update_one(
         {"_id": brand_id},
-        {"$set": {"deleted_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": {"deleted_at": datetime.now(timezone.utc)}, "$currentDate": {"updated_at": True}}
     )
+    lookup_cache.invalidate("car_brands")
     await manager.broadcast({"type": "sync", "tables": ["car_brands"]})
     return {"message": "Deleted"}
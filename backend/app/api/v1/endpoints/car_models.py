@@ -6,6 +6,7 @@ from typing import Optional
 from datetime import datetime, timezone
 import uuid
 
+from ....core.cache import lookup_cache
 from ....core.database import db
 from ....core.security import serialize_doc
 from ....models.schemas import CarModelCreate
@@ -15,11 +16,17 @@ router = APIRouter(prefix="/car-models")
 
 @router.get("")
 async def get_car_models(brand_id: Optional[str] = None):
+    cache_key = f"car_models:brand:{brand_id}"
+    cached = lookup_cache.get(cache_key)
+    if cached is not None:
+        return cached
     query = {"deleted_at": None}
     if brand_id:
         query["brand_id"] = brand_id
     models = await db.car_models.find(query).sort("name", 1).to_list(1000)
-    return [serialize_doc(m) for m in models]
+    result = [serialize_doc(m) for m in models]
+    lookup_cache.set(cache_key, result)
+    return result
 
 @router.get("/{model_id}")
 async def get_car_model(model_id: str):
@@ -52,6 +59,7 @@ async def create_car_model(model: CarModelCreate):
         "deleted_at": None
     }
     await db.car_models.insert_one(doc)
+    lookup_cache.invalidate("car_models")
     await manager.broadcast({"type": "sync", "tables": ["car_models"]})
     return serialize_doc(doc)
 
@@ -59,16 +67,35 @@ async def create_car_model(model: CarModelCreate):
 async def update_car_model(model_id: str, model: CarModelCreate):
     await db.car_models.update_one(
         {"_id": model_id},
-        {"$set": {**model.dict(), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": model.dict(), "$currentDate": {"updated_at": True}}
     )
-    await manager.broadcast({"type": "sync", "tables": ["car_models"]})
+    # Refresh the denormalized compatibility fields on products whose first
+    # compatible model is this one
+    compat_fields = {
+        "compatible_car_model": model.name or "",
+        "compatible_car_model_ar": model.name_ar or "",
+        "compatible_car_year_from": model.year_start,
+        "compatible_car_year_to": model.year_end,
+    }
+    if model.brand_id:
+        car_brand = await db.car_brands.find_one({"_id": model.brand_id}, {"name": 1, "name_ar": 1})
+        if car_brand:
+            compat_fields["compatible_car_brand"] = car_brand.get("name", "")
+            compat_fields["compatible_car_brand_ar"] = car_brand.get("name_ar", "")
+    await db.products.update_many(
+        {"car_model_ids.0": model_id},
+        {"$set": {**compat_fields}, "$currentDate": {"updated_at": True}}
+    )
+    lookup_cache.invalidate("car_models")
+    await manager.broadcast({"type": "sync", "tables": ["car_models", "products"]})
     return {"message": "Updated"}
 
 @router.delete("/{model_id}")
 async def delete_car_model(model_id: str):
     await db.car_models.update_one(
         {"_id": model_id},
-        {"$set": {"deleted_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": {"deleted_at": datetime.now(timezone.utc)}, "$currentDate": {"updated_at": True}}
     )
+    lookup_cache.invalidate("car_models")
     await manager.broadcast({"type": "sync", "tables": ["car_models"]})
     return {"message": "Deleted"}
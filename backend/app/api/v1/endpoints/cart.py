@@ -1,9 +1,12 @@
 """
 Cart Routes - Server-Side Cart System
+
+Carts are 1:1 with users, so cart documents are keyed by the user id
+directly: every read is a primary-key lookup and writes upsert, with no
+separate find-then-insert round trip and no secondary user_id index.
 """
 from fastapi import APIRouter, HTTPException, Request
 from datetime import datetime, timezone
-import uuid
 
 from ....core.database import db
 from ....core.security import get_current_user, serialize_doc
@@ -18,7 +21,7 @@ async def get_cart(request: Request):
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    cart = await db.carts.find_one({"user_id": user["id"]})
+    cart = await db.carts.find_one({"_id": user["id"]})
     if not cart:
         return {
             "user_id": user["id"],
@@ -31,9 +34,14 @@ async def get_cart(request: Request):
     items = []
     subtotal = 0
     total_discount = 0
-    
-    for item in cart.get("items", []):
-        product = await db.products.find_one({"_id": item["product_id"]})
+
+    cart_items = cart.get("items", [])
+    product_ids = list({item["product_id"] for item in cart_items})
+    products = await db.products.find({"_id": {"$in": product_ids}}).to_list(len(product_ids))
+    product_map = {p["_id"]: p for p in products}
+
+    for item in cart_items:
+        product = product_map.get(item["product_id"])
         if product:
             product_data = serialize_doc(product)
             original_price = item.get("original_unit_price", product["price"])
@@ -100,16 +108,9 @@ async def add_to_cart(item: CartItemAdd, request: Request):
         "added_at": datetime.now(timezone.utc)
     }
     
-    cart = await db.carts.find_one({"user_id": user["id"]})
-    if not cart:
-        await db.carts.insert_one({
-            "_id": str(uuid.uuid4()),
-            "user_id": user["id"],
-            "items": [cart_item],
-            "updated_at": datetime.now(timezone.utc)
-        })
-    else:
-        existing_idx = None
+    cart = await db.carts.find_one({"_id": user["id"]})
+    existing_idx = None
+    if cart:
         for idx, existing_item in enumerate(cart.get("items", [])):
             if existing_item["product_id"] == item.product_id:
                 if item.bundle_group_id:
@@ -119,24 +120,26 @@ async def add_to_cart(item: CartItemAdd, request: Request):
                 elif not existing_item.get("bundle_group_id"):
                     existing_idx = idx
                     break
-        
-        if existing_idx is not None:
-            await db.carts.update_one(
-                {"user_id": user["id"]},
-                {
-                    "$inc": {f"items.{existing_idx}.quantity": item.quantity},
-                    "$set": {"updated_at": datetime.now(timezone.utc)}
-                }
-            )
-        else:
-            await db.carts.update_one(
-                {"user_id": user["id"]},
-                {
-                    "$push": {"items": cart_item},
-                    "$set": {"updated_at": datetime.now(timezone.utc)}
-                }
-            )
-    
+
+    if existing_idx is not None:
+        await db.carts.update_one(
+            {"_id": user["id"]},
+            {
+                "$inc": {f"items.{existing_idx}.quantity": item.quantity},
+                "$currentDate": {"updated_at": True}
+            }
+        )
+    else:
+        await db.carts.update_one(
+            {"_id": user["id"]},
+            {
+                "$push": {"items": cart_item},
+                "$set": {"user_id": user["id"]},
+                "$currentDate": {"updated_at": True}
+            },
+            upsert=True
+        )
+
     return {"message": "Added", "item": cart_item}
 
 @router.put("/update")
@@ -148,20 +151,18 @@ async def update_cart(item: CartItemAdd, request: Request):
     
     if item.quantity <= 0:
         await db.carts.update_one(
-            {"user_id": user["id"]},
+            {"_id": user["id"]},
             {
                 "$pull": {"items": {"product_id": item.product_id}},
-                "$set": {"updated_at": datetime.now(timezone.utc)}
+                "$currentDate": {"updated_at": True}
             }
         )
     else:
         await db.carts.update_one(
-            {"user_id": user["id"], "items.product_id": item.product_id},
+            {"_id": user["id"], "items.product_id": item.product_id},
             {
-                "$set": {
-                    "items.$.quantity": item.quantity,
-                    "updated_at": datetime.now(timezone.utc)
-                }
+                "$set": {"items.$.quantity": item.quantity},
+                "$currentDate": {"updated_at": True}
             }
         )
     return {"message": "Updated"}
@@ -188,22 +189,15 @@ async def add_to_cart_enhanced(item: CartItemAddEnhanced, request: Request):
         "added_at": datetime.now(timezone.utc)
     }
     
-    cart = await db.carts.find_one({"user_id": user["id"]})
-    if not cart:
-        await db.carts.insert_one({
-            "_id": str(uuid.uuid4()),
-            "user_id": user["id"],
-            "items": [cart_item],
-            "updated_at": datetime.now(timezone.utc)
-        })
-    else:
-        await db.carts.update_one(
-            {"user_id": user["id"]},
-            {
-                "$push": {"items": cart_item},
-                "$set": {"updated_at": datetime.now(timezone.utc)}
-            }
-        )
+    await db.carts.update_one(
+        {"_id": user["id"]},
+        {
+            "$push": {"items": cart_item},
+            "$set": {"user_id": user["id"]},
+            "$currentDate": {"updated_at": True}
+        },
+        upsert=True
+    )
     
     return {"message": "Added", "item": cart_item}
 
@@ -213,8 +207,8 @@ async def clear_cart(request: Request):
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     await db.carts.update_one(
-        {"user_id": user["id"]},
-        {"$set": {"items": [], "updated_at": datetime.now(timezone.utc)}}
+        {"_id": user["id"]},
+        {"$set": {"items": []}, "$currentDate": {"updated_at": True}}
     )
     return {"message": "Cleared"}
 
@@ -225,7 +219,7 @@ async def void_bundle_discount(bundle_group_id: str, request: Request):
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    cart = await db.carts.find_one({"user_id": user["id"]})
+    cart = await db.carts.find_one({"_id": user["id"]})
     if not cart:
         return {"message": "Cart not found"}
     
@@ -238,8 +232,8 @@ async def void_bundle_discount(bundle_group_id: str, request: Request):
         updated_items.append(item)
     
     await db.carts.update_one(
-        {"user_id": user["id"]},
-        {"$set": {"items": updated_items, "updated_at": datetime.now(timezone.utc)}}
+        {"_id": user["id"]},
+        {"$set": {"items": updated_items}, "$currentDate": {"updated_at": True}}
     )
     return {"message": "Bundle voided"}
 
@@ -250,15 +244,23 @@ async def validate_cart_stock(request: Request):
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    cart = await db.carts.find_one({"user_id": user["id"]})
+    cart = await db.carts.find_one({"_id": user["id"]})
     if not cart or not cart.get("items"):
         return {"valid": True, "invalid_items": [], "message": "Cart is empty"}
     
     invalid_items = []
     valid_items = []
-    
-    for item in cart.get("items", []):
-        product = await db.products.find_one({"_id": item["product_id"]})
+
+    cart_items = cart.get("items", [])
+    product_ids = list({item["product_id"] for item in cart_items})
+    products = await db.products.find(
+        {"_id": {"$in": product_ids}},
+        {"name": 1, "stock_quantity": 1}
+    ).to_list(len(product_ids))
+    product_map = {p["_id"]: p for p in products}
+
+    for item in cart_items:
+        product = product_map.get(item["product_id"])
         if not product:
             invalid_items.append({
                 "product_id": item["product_id"],
@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 import uuid
 import logging
 
+from ....core.cache import lookup_cache
 from ....core.database import db
 from ....core.security import serialize_doc
 from ....models.schemas import CategoryCreate
@@ -17,21 +18,35 @@ router = APIRouter(prefix="/categories")
 
 @router.get("")
 async def get_categories(parent_id: Optional[str] = None):
+    cache_key = f"categories:parent:{parent_id}"
+    cached = lookup_cache.get(cache_key)
+    if cached is not None:
+        return cached
     query = {"deleted_at": None}
     if parent_id is None:
         query["parent_id"] = None
     else:
         query["parent_id"] = parent_id
     categories = await db.categories.find(query).sort([("sort_order", 1), ("name", 1)]).to_list(1000)
-    return [serialize_doc(c) for c in categories]
+    result = [serialize_doc(c) for c in categories]
+    lookup_cache.set(cache_key, result)
+    return result
 
 @router.get("/all")
 async def get_all_categories():
+    cached = lookup_cache.get("categories:all")
+    if cached is not None:
+        return cached
     categories = await db.categories.find({"deleted_at": None}).sort([("sort_order", 1), ("name", 1)]).to_list(1000)
-    return [serialize_doc(c) for c in categories]
+    result = [serialize_doc(c) for c in categories]
+    lookup_cache.set("categories:all", result)
+    return result
 
 @router.get("/tree")
 async def get_categories_tree():
+    cached = lookup_cache.get("categories:tree")
+    if cached is not None:
+        return cached
     categories = await db.categories.find({"deleted_at": None}).sort([("sort_order", 1), ("name", 1)]).to_list(1000)
     all_cats = [serialize_doc(c) for c in categories]
     cats_by_id = {c["id"]: {**c, "children": []} for c in all_cats}
@@ -41,6 +56,7 @@ async def get_categories_tree():
             cats_by_id[c["parent_id"]]["children"].append(cats_by_id[c["id"]])
         elif not c.get("parent_id"):
             root.append(cats_by_id[c["id"]])
+    lookup_cache.set("categories:tree", root)
     return root
 
 @router.post("")
@@ -55,6 +71,7 @@ async def create_category(category: CategoryCreate):
         "deleted_at": None
     }
     await db.categories.insert_one(doc)
+    lookup_cache.invalidate("categories")
     await manager.broadcast({"type": "sync", "tables": ["categories"]})
     return serialize_doc(doc)
 
@@ -63,17 +80,27 @@ async def update_category(cat_id: str, category: CategoryCreate):
     logger.info(f"Updating category: {cat_id}, image_data present: {bool(category.image_data)}")
     await db.categories.update_one(
         {"_id": cat_id},
-        {"$set": {**category.dict(), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": {**category.dict()}, "$currentDate": {"updated_at": True}}
     )
     updated = await db.categories.find_one({"_id": cat_id})
-    await manager.broadcast({"type": "sync", "tables": ["categories"]})
+    # Refresh the denormalized category fields stored on product documents
+    await db.products.update_many(
+        {"category_id": cat_id},
+        {"$set": {
+            "category_name": category.name or "",
+            "category_name_ar": category.name_ar or "",
+        }, "$currentDate": {"updated_at": True}}
+    )
+    lookup_cache.invalidate("categories")
+    await manager.broadcast({"type": "sync", "tables": ["categories", "products"]})
     return serialize_doc(updated)
 
 @router.delete("/{cat_id}")
 async def delete_category(cat_id: str):
     await db.categories.update_one(
         {"_id": cat_id},
-        {"$set": {"deleted_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": {"deleted_at": datetime.now(timezone.utc)}, "$currentDate": {"updated_at": True}}
     )
+    lookup_cache.invalidate("categories")
     await manager.broadcast({"type": "sync", "tables": ["categories"]})
     return {"message": "Deleted"}
@@ -3,9 +3,9 @@ Comments Routes
 """
 from fastapi import APIRouter, HTTPException, Request
 from datetime import datetime, timezone
-import uuid
 
 from ....core.database import db
+from ....core.ids import generate_uuid
 from ....core.security import get_current_user, serialize_doc
 from ....models.schemas import CommentCreate
 
@@ -43,7 +43,7 @@ async def add_comment(product_id: str, data: CommentCreate, request: Request):
         raise HTTPException(status_code=400, detail="Rating must be 1-5")
     
     comment = {
-        "_id": str(uuid.uuid4()),
+        "_id": generate_uuid(),
         "product_id": product_id,
         "user_id": user["id"],
         "user_name": user["name"],
@@ -54,9 +54,12 @@ async def get_customer_favorites(customer_id: str, request: Request):
         raise HTTPException(status_code=403, detail="Access denied")
     
     favs = await db.favorites.find({"user_id": customer_id, "deleted_at": None}).to_list(1000)
+    product_ids = list({f["product_id"] for f in favs})
+    products = await db.products.find({"_id": {"$in": product_ids}}).to_list(len(product_ids))
+    product_map = {p["_id"]: p for p in products}
     result = []
     for f in favs:
-        product = await db.products.find_one({"_id": f["product_id"]})
+        product = product_map.get(f["product_id"])
         if product:
             result.append({**serialize_doc(f), "product": serialize_doc(product)})
     return {"favorites": result, "total": len(result)}
@@ -68,13 +71,17 @@ async def get_customer_cart(customer_id: str, request: Request):
     if role not in ["owner", "partner", "admin"]:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    cart = await db.carts.find_one({"user_id": customer_id})
+    cart = await db.carts.find_one({"_id": customer_id})
     if not cart:
         return {"items": [], "total": 0}
     
+    cart_items = cart.get("items", [])
+    product_ids = list({item["product_id"] for item in cart_items})
+    products = await db.products.find({"_id": {"$in": product_ids}}).to_list(len(product_ids))
+    product_map = {p["_id"]: p for p in products}
     items = []
-    for item in cart.get("items", []):
-        product = await db.products.find_one({"_id": item["product_id"]})
+    for item in cart_items:
+        product = product_map.get(item["product_id"])
         if product:
             items.append({**item, "product": serialize_doc(product)})
     return {"items": items, "total": len(items)}
@@ -3,9 +3,10 @@ Distributor Routes
 """
 from fastapi import APIRouter, HTTPException, Request
 from datetime import datetime, timezone
-import uuid
 
+from ....core.cache import lookup_cache
 from ....core.database import db
+from ....core.ids import generate_uuid
 from ....core.security import get_current_user, get_user_role, serialize_doc
 from ....models.schemas import DistributorCreate
 from ....services.websocket import manager
@@ -37,7 +38,7 @@ async def create_distributor(data: DistributorCreate, request: Request):
         raise HTTPException(status_code=403, detail="Access denied")
     
     distributor = {
-        "_id": str(uuid.uuid4()),
+        "_id": generate_uuid(),
         **data.dict(),
         "created_at": datetime.now(timezone.utc),
         "updated_at": datetime.now(timezone.utc),
@@ -51,6 +52,7 @@ async def create_distributor(data: DistributorCreate, request: Request):
             {"$set": {"distributor_id": distributor["_id"]}}
         )
     
+    lookup_cache.invalidate("car_brands")
     await manager.broadcast({"type": "sync", "tables": ["distributors", "car_brands"]})
     return serialize_doc(distributor)
 
@@ -64,7 +66,7 @@ async def update_distributor(distributor_id: str, data: DistributorCreate, reque
     await db.car_brands.update_many({"distributor_id": distributor_id}, {"$set": {"distributor_id": None}})
     await db.distributors.update_one(
         {"_id": distributor_id},
-        {"$set": {**data.dict(), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": data.dict(), "$currentDate": {"updated_at": True}}
     )
     
     if data.linked_car_brand_ids:
@@ -73,6 +75,7 @@ async def update_distributor(distributor_id: str, data: DistributorCreate, reque
             {"$set": {"distributor_id": distributor_id}}
         )
     
+    lookup_cache.invalidate("car_brands")
     await manager.broadcast({"type": "sync", "tables": ["distributors", "car_brands"]})
     return {"message": "Updated"}
 
@@ -85,5 +88,6 @@ async def delete_distributor(distributor_id: str, request: Request):
     
     await db.car_brands.update_many({"distributor_id": distributor_id}, {"$set": {"distributor_id": None}})
     await db.distributors.update_one({"_id": distributor_id}, {"$set": {"deleted_at": datetime.now(timezone.utc)}})
+    lookup_cache.invalidate("car_brands")
     await manager.broadcast({"type": "sync", "tables": ["distributors", "car_brands"]})
     return {"message": "Deleted"}
@@ -3,9 +3,9 @@ Favorites Routes
 """
 from fastapi import APIRouter, HTTPException, Request
 from datetime import datetime, timezone
-import uuid
 
 from ....core.database import db
+from ....core.ids import generate_uuid
 from ....core.security import get_current_user, serialize_doc
 from ....models.schemas import FavoriteAdd
 
@@ -18,9 +18,12 @@ async def get_favorites(request: Request):
         raise HTTPException(status_code=401, detail="Not authenticated")
     
     favs = await db.favorites.find({"user_id": user["id"], "deleted_at": None}).to_list(1000)
+    product_ids = list({f["product_id"] for f in favs})
+    products = await db.products.find({"_id": {"$in": product_ids}}).to_list(len(product_ids))
+    product_map = {p["_id"]: p for p in products}
     result = []
     for f in favs:
-        product = await db.products.find_one({"_id": f["product_id"]})
+        product = product_map.get(f["product_id"])
         if product:
             result.append({**serialize_doc(f), "product": serialize_doc(product)})
     return {"favorites": result, "total": len(result)}
@@ -45,18 +48,18 @@ async def toggle_favorite(data: FavoriteAdd, request: Request):
         if existing.get("deleted_at"):
             await db.favorites.update_one(
                 {"_id": existing["_id"]},
-                {"$set": {"deleted_at": None, "updated_at": datetime.now(timezone.utc)}}
+                {"$set": {"deleted_at": None}, "$currentDate": {"updated_at": True}}
             )
             return {"is_favorite": True}
         else:
             await db.favorites.update_one(
                 {"_id": existing["_id"]},
-                {"$set": {"deleted_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)}}
+                {"$set": {"deleted_at": datetime.now(timezone.utc)}, "$currentDate": {"updated_at": True}}
             )
             return {"is_favorite": False}
     else:
         await db.favorites.insert_one({
-            "_id": str(uuid.uuid4()),
+            "_id": generate_uuid(),
             "user_id": user["id"],
             "product_id": data.product_id,
             "created_at": datetime.now(timezone.utc),
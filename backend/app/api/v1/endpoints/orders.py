@@ -4,9 +4,10 @@ Order Routes with Cursor-Based Pagination
 from fastapi import APIRouter, HTTPException, Request
 from typing import Optional
 from datetime import datetime, timezone
-import uuid
+from pymongo import ReturnDocument
 
 from ....core.database import db
+from ....core.ids import generate_uuid
 from ....core.config import settings
 from ....core.security import get_current_user, get_user_role, serialize_doc
 from ....models.schemas import OrderCreate, AdminOrderCreate, AdminAssistedOrderCreate
@@ -19,9 +20,44 @@ from ....services.notification import (
 
 router = APIRouter(prefix="/orders")
 
-def generate_order_number():
-    import random
-    return f"ORD-{datetime.now().strftime('%Y%m%d')}-{random.randint(10000, 99999)}"
+# Closed status vocabulary - keep in sync with ORDER_STATUS_MESSAGES in the
+# notification service
+ORDER_STATUSES = frozenset({
+    "pending", "confirmed", "preparing", "shipped",
+    "out_for_delivery", "delivered", "completed", "cancelled",
+})
+
+async def generate_order_number():
+    """Next order number from an atomic counter - monotonic and collision-free,
+    unlike the old date+random scheme which could collide under load"""
+    counter = await db.counters.find_one_and_update(
+        {"_id": "order_number"},
+        {"$inc": {"seq": 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    return f"ORD-{counter['seq']:07d}"
+
+async def enrich_order_items(items):
+    """Fill missing image/name fields on order items with one batched lookup"""
+    missing_ids = list({item.get("product_id") for item in items if not item.get("image_url")})
+    if not missing_ids:
+        return items
+    products = await db.products.find(
+        {"_id": {"$in": missing_ids}},
+        {"image_url": 1, "name": 1, "name_ar": 1}
+    ).to_list(len(missing_ids))
+    product_map = {p["_id"]: p for p in products}
+    enriched_items = []
+    for item in items:
+        if not item.get("image_url"):
+            product = product_map.get(item.get("product_id"))
+            if product:
+                item["image_url"] = product.get("image_url")
+                item["product_name"] = item.get("product_name") or product.get("name")
+                item["product_name_ar"] = item.get("product_name_ar") or product.get("name_ar")
+        enriched_items.append(item)
+    return enriched_items
 
 @router.get("")
 async def get_orders(
@@ -110,17 +146,7 @@ async def get_order(order_id: str, request: Request):
     if not is_admin_role and not is_order_owner:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    enriched_items = []
-    for item in order.get("items", []):
-        if not item.get("image_url"):
-            product = await db.products.find_one({"_id": item.get("product_id")})
-            if product:
-                item["image_url"] = product.get("image_url")
-                item["product_name"] = item.get("product_name") or product.get("name")
-                item["product_name_ar"] = item.get("product_name_ar") or product.get("name_ar")
-        enriched_items.append(item)
-    
-    order["items"] = enriched_items
+    order["items"] = await enrich_order_items(order.get("items", []))
     return serialize_doc(order)
 
 @router.post("")
@@ -130,7 +156,7 @@ async def create_order(data: OrderCreate, request: Request):
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    cart = await db.carts.find_one({"user_id": user["id"]})
+    cart = await db.carts.find_one({"_id": user["id"]})
     if not cart or not cart.get("items"):
         raise HTTPException(status_code=400, detail="Cart is empty")
     
@@ -138,8 +164,13 @@ async def create_order(data: OrderCreate, request: Request):
     subtotal = 0
     total_discount = 0
     
-    for item in cart.get("items", []):
-        product = await db.products.find_one({"_id": item["product_id"]})
+    cart_items = cart.get("items", [])
+    product_ids = list({item["product_id"] for item in cart_items})
+    products = await db.products.find({"_id": {"$in": product_ids}}).to_list(len(product_ids))
+    product_map = {p["_id"]: p for p in products}
+
+    for item in cart_items:
+        product = product_map.get(item["product_id"])
         if not product:
             continue
         
@@ -173,8 +204,8 @@ async def create_order(data: OrderCreate, request: Request):
     total = subtotal - total_discount + settings.SHIPPING_COST
     
     order_doc = {
-        "_id": str(uuid.uuid4()),
-        "order_number": generate_order_number(),
+        "_id": generate_uuid(),
+        "order_number": await generate_order_number(),
         "user_id": user["id"],
         "user_name": user.get("name", f"{data.first_name} {data.last_name}"),
         "user_email": user.get("email", data.email),
@@ -202,7 +233,7 @@ async def create_order(data: OrderCreate, request: Request):
     }
     
     await db.orders.insert_one(order_doc)
-    await db.carts.update_one({"user_id": user["id"]}, {"$set": {"items": []}})
+    await db.carts.update_one({"_id": user["id"]}, {"$set": {"items": []}})
     
     await create_notification(
         user["id"],
@@ -225,13 +256,16 @@ async def update_order_status(order_id: str, status: str, request: Request):
     if role not in ["owner", "partner", "admin"]:
         raise HTTPException(status_code=403, detail="Access denied")
     
+    if status not in ORDER_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
+    
     order = await db.orders.find_one({"_id": order_id})
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     
     await db.orders.update_one(
         {"_id": order_id},
-        {"$set": {"status": status, "updated_at": datetime.now(timezone.utc)}}
+        {"$set": {"status": status}, "$currentDate": {"updated_at": True}}
     )
     
     if order.get("user_id"):
@@ -278,7 +312,7 @@ async def update_order_discount(order_id: str, request: Request):
     
     await db.orders.update_one(
         {"_id": order_id},
-        {"$set": {"discount": discount, "total": new_total, "updated_at": datetime.now(timezone.utc)}}
+        {"$set": {"discount": discount, "total": new_total}, "$currentDate": {"updated_at": True}}
     )
     
     await manager.broadcast({"type": "sync", "tables": ["orders"]})
@@ -316,8 +350,12 @@ async def create_admin_order(data: AdminOrderCreate, request: Request):
     items = []
     subtotal = 0
     
+    product_ids = list({item_data.get("product_id") for item_data in data.items})
+    products = await db.products.find({"_id": {"$in": product_ids}}).to_list(len(product_ids))
+    product_map = {p["_id"]: p for p in products}
+
     for item_data in data.items:
-        product = await db.products.find_one({"_id": item_data.get("product_id")})
+        product = product_map.get(item_data.get("product_id"))
         if not product:
             continue
         
@@ -346,8 +384,8 @@ async def create_admin_order(data: AdminOrderCreate, request: Request):
     total = subtotal + settings.SHIPPING_COST
     
     order_doc = {
-        "_id": str(uuid.uuid4()),
-        "order_number": generate_order_number(),
+        "_id": generate_uuid(),
+        "order_number": await generate_order_number(),
         "user_id": data.user_id,
         "user_name": f"{data.first_name} {data.last_name}",
         "user_email": data.email,
@@ -397,17 +435,7 @@ async def get_admin_order_detail(order_id: str, request: Request):
     if not is_admin_role and not is_order_owner:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    enriched_items = []
-    for item in order.get("items", []):
-        if not item.get("image_url"):
-            product = await db.products.find_one({"_id": item.get("product_id")})
-            if product:
-                item["image_url"] = product.get("image_url")
-                item["product_name"] = item.get("product_name") or product.get("name")
-                item["product_name_ar"] = item.get("product_name_ar") or product.get("name_ar")
-        enriched_items.append(item)
-    
-    order["items"] = enriched_items
+    order["items"] = await enrich_order_items(order.get("items", []))
     
     if "delivery_address" not in order and order.get("shipping_address"):
         parts = order.get("shipping_address", "").split(", ")
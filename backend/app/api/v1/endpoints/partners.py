@@ -3,9 +3,9 @@ Partner Routes
 """
 from fastapi import APIRouter, HTTPException, Request
 from datetime import datetime, timezone
-import uuid
 
 from ....core.database import db
+from ....core.ids import generate_uuid
 from ....core.config import PRIMARY_OWNER_EMAIL
 from ....core.security import get_current_user, get_user_role, serialize_doc
 from ....models.schemas import PartnerCreate
@@ -36,7 +36,7 @@ async def add_partner(data: PartnerCreate, request: Request):
         raise HTTPException(status_code=400, detail="Partner already exists")
     
     partner = {
-        "_id": str(uuid.uuid4()),
+        "_id": generate_uuid(),
         "email": data.email,
         "name": data.email.split("@")[0],
         "created_at": datetime.now(timezone.utc),
@@ -5,6 +5,7 @@ from fastapi import APIRouter
 from datetime import datetime, timezone
 import uuid
 
+from ....core.cache import lookup_cache
 from ....core.database import db
 from ....core.security import serialize_doc
 from ....models.schemas import ProductBrandCreate
@@ -14,6 +15,9 @@ router = APIRouter(prefix="/product-brands")
 
 @router.get("")
 async def get_product_brands():
+    cached = lookup_cache.get("product_brands")
+    if cached is not None:
+        return cached
     brands = await db.product_brands.find({"deleted_at": None}).sort("name", 1).to_list(1000)
     result = []
     for b in brands:
@@ -22,6 +26,7 @@ async def get_product_brands():
             supplier = await db.suppliers.find_one({"_id": b["supplier_id"]})
             b_data["supplier"] = serialize_doc(supplier) if supplier else None
         result.append(b_data)
+    lookup_cache.set("product_brands", result)
     return result
 
 @router.post("")
@@ -34,6 +39,7 @@ async def create_product_brand(brand: ProductBrandCreate):
         "deleted_at": None
     }
     await db.product_brands.insert_one(doc)
+    lookup_cache.invalidate("product_brands")
     await manager.broadcast({"type": "sync", "tables": ["product_brands"]})
     return serialize_doc(doc)
 
@@ -41,17 +47,29 @@ async def create_product_brand(brand: ProductBrandCreate):
 async def update_product_brand(brand_id: str, brand: ProductBrandCreate):
     await db.product_brands.update_one(
         {"_id": brand_id},
-        {"$set": {**brand.dict(), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": {**brand.dict()}, "$currentDate": {"updated_at": True}}
     )
     updated = await db.product_brands.find_one({"_id": brand_id})
-    await manager.broadcast({"type": "sync", "tables": ["product_brands"]})
+    # Refresh the denormalized brand fields stored on product documents
+    await db.products.update_many(
+        {"product_brand_id": brand_id},
+        {"$set": {
+            "product_brand_name": brand.name or "",
+            "product_brand_name_ar": brand.name_ar or "",
+            "manufacturer_country": brand.country_of_origin or "",
+            "manufacturer_country_ar": brand.country_of_origin_ar or "",
+        }, "$currentDate": {"updated_at": True}}
+    )
+    lookup_cache.invalidate("product_brands")
+    await manager.broadcast({"type": "sync", "tables": ["product_brands", "products"]})
     return serialize_doc(updated)
 
 @router.delete("/{brand_id}")
 async def delete_product_brand(brand_id: str):
     await db.product_brands.update_one(
         {"_id": brand_id},
-        {"$set": {"deleted_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": {"deleted_at": datetime.now(timezone.utc)}, "$currentDate": {"updated_at": True}}
     )
+    lookup_cache.invalidate("product_brands")
     await manager.broadcast({"type": "sync", "tables": ["product_brands"]})
     return {"message": "Deleted"}
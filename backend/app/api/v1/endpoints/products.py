@@ -14,6 +14,63 @@ from ....services.notification import notify_admins_product_change
 
 router = APIRouter(prefix="/products")
 
+# Projections for enrichment lookups: exclude base64 logo/image blobs so the
+# list endpoints only pull the scalar fields they actually read.
+BRAND_LOOKUP_FIELDS = {"name": 1, "name_ar": 1, "country_of_origin": 1, "country_of_origin_ar": 1}
+CAR_MODEL_LOOKUP_FIELDS = {"name": 1, "name_ar": 1, "brand_id": 1, "year_start": 1, "year_end": 1}
+CAR_BRAND_LOOKUP_FIELDS = {"name": 1, "name_ar": 1}
+
+async def build_denormalized_fields(doc):
+    """
+    Resolve the brand/category/car-model display fields stored directly on
+    product documents so list views render without extra lookups.
+    Refreshed on product writes and fanned out on brand/category renames.
+    Every group starts from its empty value, so clearing a reference
+    (brand/category set to None, car model list emptied) also clears the
+    previously denormalized fields instead of leaving them stale.
+    """
+    fields = {
+        "product_brand_name": "",
+        "product_brand_name_ar": "",
+        "manufacturer_country": "",
+        "manufacturer_country_ar": "",
+        "category_name": "",
+        "category_name_ar": "",
+        "compatible_car_model": "",
+        "compatible_car_model_ar": "",
+        "compatible_car_models_count": 0,
+        "compatible_car_year_from": None,
+        "compatible_car_year_to": None,
+        "compatible_car_brand": "",
+        "compatible_car_brand_ar": "",
+    }
+    if doc.get("product_brand_id"):
+        brand = await db.product_brands.find_one({"_id": doc["product_brand_id"]}, BRAND_LOOKUP_FIELDS)
+        if brand:
+            fields["product_brand_name"] = brand.get("name", "")
+            fields["product_brand_name_ar"] = brand.get("name_ar", "")
+            fields["manufacturer_country"] = brand.get("country_of_origin", "")
+            fields["manufacturer_country_ar"] = brand.get("country_of_origin_ar", "")
+    if doc.get("category_id"):
+        category = await db.categories.find_one({"_id": doc["category_id"]}, {"name": 1, "name_ar": 1})
+        if category:
+            fields["category_name"] = category.get("name", "")
+            fields["category_name_ar"] = category.get("name_ar", "")
+    if doc.get("car_model_ids"):
+        first_model = await db.car_models.find_one({"_id": doc["car_model_ids"][0]}, CAR_MODEL_LOOKUP_FIELDS)
+        if first_model:
+            fields["compatible_car_model"] = first_model.get("name", "")
+            fields["compatible_car_model_ar"] = first_model.get("name_ar", "")
+            fields["compatible_car_models_count"] = len(doc["car_model_ids"])
+            fields["compatible_car_year_from"] = first_model.get("year_start")
+            fields["compatible_car_year_to"] = first_model.get("year_end")
+            if first_model.get("brand_id"):
+                car_brand = await db.car_brands.find_one({"_id": first_model["brand_id"]}, CAR_BRAND_LOOKUP_FIELDS)
+                if car_brand:
+                    fields["compatible_car_brand"] = car_brand.get("name", "")
+                    fields["compatible_car_brand_ar"] = car_brand.get("name_ar", "")
+    return fields
+
 @router.get("")
 async def get_products(
     category_id: Optional[str] = None,
@@ -86,25 +143,34 @@ async def get_products(
     if direction == "prev":
         products = list(reversed(products))
     
-    all_product_brands = await db.product_brands.find({"deleted_at": None}).to_list(1000)
-    all_car_models = await db.car_models.find({"deleted_at": None}).to_list(1000)
-    all_car_brands = await db.car_brands.find({"deleted_at": None}).to_list(1000)
-    
-    brand_map = {b["_id"]: serialize_doc(b) for b in all_product_brands}
-    car_model_map = {m["_id"]: serialize_doc(m) for m in all_car_models}
-    car_brand_map = {b["_id"]: serialize_doc(b) for b in all_car_brands}
-    
+    # Only resolve the brands/models actually referenced by this page instead
+    # of loading the whole lookup collections for every request.
+    brand_ids = list({p["product_brand_id"] for p in products
+                      if p.get("product_brand_id") and "product_brand_name" not in p})
+    first_model_ids = list({p["car_model_ids"][0] for p in products
+                            if p.get("car_model_ids") and "compatible_car_model" not in p})
+
+    page_brands = await db.product_brands.find({"_id": {"$in": brand_ids}}, BRAND_LOOKUP_FIELDS).to_list(len(brand_ids))
+    page_car_models = await db.car_models.find({"_id": {"$in": first_model_ids}}, CAR_MODEL_LOOKUP_FIELDS).to_list(len(first_model_ids))
+
+    brand_map = {b["_id"]: serialize_doc(b) for b in page_brands}
+    car_model_map = {m["_id"]: serialize_doc(m) for m in page_car_models}
+
+    car_brand_ids = list({m["brand_id"] for m in page_car_models if m.get("brand_id")})
+    page_car_brands = await db.car_brands.find({"_id": {"$in": car_brand_ids}}, CAR_BRAND_LOOKUP_FIELDS).to_list(len(car_brand_ids))
+    car_brand_map = {b["_id"]: serialize_doc(b) for b in page_car_brands}
+
     enriched_products = []
     for p in products:
         product_data = serialize_doc(p)
-        
+
         if p.get("product_brand_id") and p["product_brand_id"] in brand_map:
             brand = brand_map[p["product_brand_id"]]
             product_data["product_brand_name"] = brand.get("name", "")
             product_data["product_brand_name_ar"] = brand.get("name_ar", "")
             product_data["manufacturer_country"] = brand.get("country_of_origin", "")
             product_data["manufacturer_country_ar"] = brand.get("country_of_origin_ar", "")
-        
+
         if p.get("car_model_ids") and len(p["car_model_ids"]) > 0:
             first_model_id = p["car_model_ids"][0]
             if first_model_id in car_model_map:
@@ -121,9 +187,9 @@ async def get_products(
                 # Add year range
                 product_data["compatible_car_year_from"] = car_model.get("year_start")
                 product_data["compatible_car_year_to"] = car_model.get("year_end")
-        
+
         enriched_products.append(product_data)
-    
+
     next_cursor = enriched_products[-1]["id"] if enriched_products and has_more else None
     prev_cursor = enriched_products[0]["id"] if enriched_products and cursor else None
     
@@ -160,9 +226,9 @@ async def search_products(q: str = Query(..., min_length=1), limit: int = 20):
 async def get_all_products():
     products = await db.products.find({"deleted_at": None}).sort("created_at", -1).to_list(10000)
     
-    all_product_brands = await db.product_brands.find({"deleted_at": None}).to_list(1000)
-    all_car_models = await db.car_models.find({"deleted_at": None}).to_list(1000)
-    all_car_brands = await db.car_brands.find({"deleted_at": None}).to_list(1000)
+    all_product_brands = await db.product_brands.find({"deleted_at": None}, BRAND_LOOKUP_FIELDS).to_list(1000)
+    all_car_models = await db.car_models.find({"deleted_at": None}, CAR_MODEL_LOOKUP_FIELDS).to_list(1000)
+    all_car_brands = await db.car_brands.find({"deleted_at": None}, CAR_BRAND_LOOKUP_FIELDS).to_list(1000)
     
     brand_map = {b["_id"]: serialize_doc(b) for b in all_product_brands}
     car_model_map = {m["_id"]: serialize_doc(m) for m in all_car_models}
@@ -237,6 +303,7 @@ async def create_product(product: ProductCreate, request: Request):
         "updated_at": datetime.now(timezone.utc),
         "deleted_at": None
     }
+    doc.update(await build_denormalized_fields(doc))
     await db.products.insert_one(doc)
     await manager.broadcast({"type": "sync", "tables": ["products"]})
     
@@ -252,9 +319,11 @@ async def create_product(product: ProductCreate, request: Request):
 
 @router.put("/{product_id}")
 async def update_product(product_id: str, product: ProductCreate):
+    updates = product.dict()
+    updates.update(await build_denormalized_fields(updates))
     await db.products.update_one(
         {"_id": product_id},
-        {"$set": {**product.dict(), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": updates, "$currentDate": {"updated_at": True}}
     )
     await manager.broadcast({"type": "sync", "tables": ["products"]})
     return {"message": "Updated"}
@@ -263,7 +332,7 @@ async def update_product(product_id: str, product: ProductCreate):
 async def update_product_price(product_id: str, data: dict):
     await db.products.update_one(
         {"_id": product_id},
-        {"$set": {"price": data.get("price"), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": {"price": data.get("price")}, "$currentDate": {"updated_at": True}}
     )
     await manager.broadcast({"type": "sync", "tables": ["products"]})
     return {"message": "Price updated"}
@@ -272,7 +341,7 @@ async def update_product_price(product_id: str, data: dict):
 async def update_product_hidden(product_id: str, data: dict):
     await db.products.update_one(
         {"_id": product_id},
-        {"$set": {"hidden_status": data.get("hidden_status"), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": {"hidden_status": data.get("hidden_status")}, "$currentDate": {"updated_at": True}}
     )
     await manager.broadcast({"type": "sync", "tables": ["products"]})
     return {"message": "Updated"}
@@ -281,7 +350,7 @@ async def update_product_hidden(product_id: str, data: dict):
 async def delete_product(product_id: str):
     await db.products.update_one(
         {"_id": product_id},
-        {"$set": {"deleted_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": {"deleted_at": datetime.now(timezone.utc)}, "$currentDate": {"updated_at": True}}
     )
     await manager.broadcast({"type": "sync", "tables": ["products"]})
     return {"message": "Deleted"}
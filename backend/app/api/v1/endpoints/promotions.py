@@ -72,7 +72,7 @@ async def update_promotion(promotion_id: str, data: PromotionCreate, request: Re
     
     await db.promotions.update_one(
         {"_id": promotion_id},
-        {"$set": {**data.dict(), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": data.dict(), "$currentDate": {"updated_at": True}}
     )
     await manager.broadcast({"type": "sync", "tables": ["promotions"]})
     return {"message": "Updated"}
@@ -81,7 +81,7 @@ async def update_promotion(promotion_id: str, data: PromotionCreate, request: Re
 async def reorder_promotion(promotion_id: str, data: dict, request: Request):
     await db.promotions.update_one(
         {"_id": promotion_id},
-        {"$set": {"sort_order": data.get("sort_order", 0), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": {"sort_order": data.get("sort_order", 0)}, "$currentDate": {"updated_at": True}}
     )
     return {"message": "Reordered"}
 
@@ -3,9 +3,9 @@ Subscriber Routes
 """
 from fastapi import APIRouter, HTTPException, Request
 from datetime import datetime, timezone
-import uuid
 
 from ....core.database import db
+from ....core.ids import generate_uuid
 from ....core.config import PRIMARY_OWNER_EMAIL
 from ....core.security import get_current_user, get_user_role, serialize_doc
 from ....models.schemas import SubscriberCreate, SubscriptionRequestCreate
@@ -37,7 +37,7 @@ async def add_subscriber(data: SubscriberCreate, request: Request):
         raise HTTPException(status_code=400, detail="Subscriber already exists")
     
     subscriber = {
-        "_id": str(uuid.uuid4()),
+        "_id": generate_uuid(),
         "email": data.email,
         "name": data.email.split("@")[0],
         "created_at": datetime.now(timezone.utc),
@@ -73,7 +73,7 @@ async def get_subscription_requests(request: Request):
 @router.post("/subscription-requests")
 async def create_subscription_request(data: SubscriptionRequestCreate):
     request_doc = {
-        "_id": str(uuid.uuid4()),
+        "_id": generate_uuid(),
         **data.dict(),
         "status": "pending",
         "created_at": datetime.now(timezone.utc),
@@ -103,7 +103,7 @@ async def approve_subscription_request(request_id: str, request: Request):
     
     await db.subscription_requests.update_one(
         {"_id": request_id},
-        {"$set": {"status": "approved", "updated_at": datetime.now(timezone.utc)}}
+        {"$set": {"status": "approved"}, "$currentDate": {"updated_at": True}}
     )
     return {"message": "Approved"}
 
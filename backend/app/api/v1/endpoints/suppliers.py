@@ -3,9 +3,10 @@ Supplier Routes
 """
 from fastapi import APIRouter, HTTPException, Request
 from datetime import datetime, timezone
-import uuid
 
+from ....core.cache import lookup_cache
 from ....core.database import db
+from ....core.ids import generate_uuid
 from ....core.security import get_current_user, get_user_role, serialize_doc
 from ....models.schemas import SupplierCreate
 from ....services.websocket import manager
@@ -37,7 +38,7 @@ async def create_supplier(data: SupplierCreate, request: Request):
         raise HTTPException(status_code=403, detail="Access denied")
     
     supplier = {
-        "_id": str(uuid.uuid4()),
+        "_id": generate_uuid(),
         **data.dict(),
         "created_at": datetime.now(timezone.utc),
         "updated_at": datetime.now(timezone.utc),
@@ -51,6 +52,7 @@ async def create_supplier(data: SupplierCreate, request: Request):
             {"$set": {"supplier_id": supplier["_id"]}}
         )
     
+    lookup_cache.invalidate("product_brands")
     await manager.broadcast({"type": "sync", "tables": ["suppliers", "product_brands"]})
     return serialize_doc(supplier)
 
@@ -64,7 +66,7 @@ async def update_supplier(supplier_id: str, data: SupplierCreate, request: Reque
     await db.product_brands.update_many({"supplier_id": supplier_id}, {"$set": {"supplier_id": None}})
     await db.suppliers.update_one(
         {"_id": supplier_id},
-        {"$set": {**data.dict(), "updated_at": datetime.now(timezone.utc)}}
+        {"$set": data.dict(), "$currentDate": {"updated_at": True}}
     )
     
     if data.linked_product_brand_ids:
@@ -73,6 +75,7 @@ async def update_supplier(supplier_id: str, data: SupplierCreate, request: Reque
             {"$set": {"supplier_id": supplier_id}}
         )
     
+    lookup_cache.invalidate("product_brands")
     await manager.broadcast({"type": "sync", "tables": ["suppliers", "product_brands"]})
     return {"message": "Updated"}
 
@@ -85,5 +88,6 @@ async def delete_supplier(supplier_id: str, request: Request):
     
     await db.product_brands.update_many({"supplier_id": supplier_id}, {"$set": {"supplier_id": None}})
     await db.suppliers.update_one({"_id": supplier_id}, {"$set": {"deleted_at": datetime.now(timezone.utc)}})
+    lookup_cache.invalidate("product_brands")
     await manager.broadcast({"type": "sync", "tables": ["suppliers", "product_brands"]})
     return {"message": "Deleted"}
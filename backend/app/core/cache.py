@@ -0,0 +1,40 @@
+"""
+In-Process TTL Cache for Lookup Tables
+"""
+import time
+from typing import Any, Optional
+
+class TTLCache:
+    """Tiny in-process cache for small, rarely-updated lookup tables
+    (categories, car brands, car models, product brands).
+
+    These collections are read on every product list render but change
+    only through admin writes, so reads between writes can skip the
+    database entirely. Entries expire after ``ttl`` seconds as a safety
+    net; writers call ``invalidate(table)`` so changes show up
+    immediately on the instance that took the write (other instances
+    converge within the TTL)."""
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self._store: dict = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            self._store.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._store[key] = (value, time.monotonic() + self.ttl)
+
+    def invalidate(self, table: str) -> None:
+        """Drop all cached entries for a table (keys are '<table>' or '<table>:<variant>')"""
+        for key in [k for k in self._store if k == table or k.startswith(f"{table}:")]:
+            del self._store[key]
+
+lookup_cache = TTLCache(ttl=300.0)
@@ -19,6 +19,10 @@ MIN_FRONTEND_VERSION = "1.0.0"
 class Settings:
     MONGO_URL: str = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
     DB_NAME: str = os.environ.get('DB_NAME', 'test_database')
+
+    # Connection pool tuning - sized for high-QPS list endpoints
+    MONGO_MAX_POOL_SIZE: int = int(os.environ.get('MONGO_MAX_POOL_SIZE', '50'))
+    MONGO_MIN_POOL_SIZE: int = int(os.environ.get('MONGO_MIN_POOL_SIZE', '5'))
     
     # Session settings
     SESSION_EXPIRE_DAYS: int = 7
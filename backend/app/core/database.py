@@ -34,7 +34,11 @@ db = DatabaseProxy()
 async def connect_to_mongo():
     """Connect to MongoDB and return database instance"""
     global client, _db
-    client = AsyncIOMotorClient(settings.MONGO_URL)
+    client = AsyncIOMotorClient(
+        settings.MONGO_URL,
+        maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+        minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+    )
     _db = client[settings.DB_NAME]
     logger.info(f"Connected to MongoDB - ALghazaly Auto Parts API v4.1")
     return _db
@@ -61,12 +65,43 @@ async def create_database_indexes():
     """
     try:
         logger.info("Creating database indexes...")
-        
-        # Products indexes
-        await db.products.create_index("deleted_at", background=True)
+
+        # Index management lives entirely in this startup hook, so indexes
+        # this hook used to create have to be dropped here too - otherwise
+        # existing deployments keep paying their write amplification forever.
+        # Best-effort: fresh databases have nothing to drop.
+        for collection, index_name in (
+            (db.products, "deleted_at_1"),
+            (db.orders, "deleted_at_1"),
+            (db.orders, "user_id_1"),
+            # Safe only because the analytics overview query filters
+            # deleted_at: None, putting its date range on the
+            # (deleted_at, created_at) compound below
+            (db.orders, "created_at_1"),
+            (db.categories, "deleted_at_1"),
+            (db.car_brands, "deleted_at_1"),
+            (db.car_models, "deleted_at_1"),
+            (db.product_brands, "deleted_at_1"),
+            (db.notifications, "user_id_1"),
+            # Replaced by the named partial is_active indexes below
+            (db.promotions, "is_active_1"),
+            (db.bundle_offers, "is_active_1"),
+        ):
+            try:
+                await collection.drop_index(index_name)
+                logger.info(f"Dropped obsolete index {index_name} on {collection.name}")
+            except Exception:
+                pass  # not present - fresh deployment or already dropped
+
+        # Products indexes. No standalone deleted_at index: every compound
+        # below leads with deleted_at, and a single-column index that is a
+        # prefix of a compound only adds write amplification.
         await db.products.create_index("category_id", background=True)
         await db.products.create_index("product_brand_id", background=True)
         await db.products.create_index("car_model_ids", background=True)
+        # Legacy compatibility field still queried via $or in the car-model
+        # detail endpoint; both $or branches need an index for an index union
+        await db.products.create_index("compatible_car_models", background=True)
         await db.products.create_index("price", background=True)
         await db.products.create_index("sku", background=True)
         await db.products.create_index("name", background=True)
@@ -76,7 +111,21 @@ async def create_database_indexes():
         await db.products.create_index([("deleted_at", 1), ("car_model_ids", 1)], background=True)
         await db.products.create_index([("created_at", -1), ("_id", -1)], background=True)
         
+        # Sync pull indexes - /sync/pull filters {deleted_at: None,
+        # updated_at: {$gt: last_pulled_at}}, so the compound index covers the
+        # equality part and turns the pull into a bounded range scan of the
+        # recent tail instead of filtering after an updated_at-only scan.
+        await db.products.create_index([("deleted_at", 1), ("updated_at", 1)], background=True)
+        await db.categories.create_index([("deleted_at", 1), ("updated_at", 1)], background=True)
+        await db.car_brands.create_index([("deleted_at", 1), ("updated_at", 1)], background=True)
+        await db.car_models.create_index([("deleted_at", 1), ("updated_at", 1)], background=True)
+        await db.product_brands.create_index([("deleted_at", 1), ("updated_at", 1)], background=True)
+
         # Sessions indexes
+        # Auth lookups go through the fixed-width token_hash fingerprint; the
+        # raw session_token index only serves pre-hash sessions and can be
+        # dropped once those have aged past SESSION_EXPIRE_DAYS.
+        await db.sessions.create_index("token_hash", background=True)
         await db.sessions.create_index("session_token", background=True)
         await db.sessions.create_index("user_id", background=True)
         await db.sessions.create_index("expires_at", background=True)
@@ -85,27 +134,35 @@ async def create_database_indexes():
         await db.users.create_index("email", background=True)
         
         # Orders indexes
-        await db.orders.create_index("deleted_at", background=True)
-        await db.orders.create_index("user_id", background=True)
+        # User-scoped listing filters (user_id, deleted_at) and sorts on
+        # (created_at, _id) desc; the compound index serves the whole query.
+        # The standalone created_at index it obsoleted is gone - the admin
+        # listing sort and the analytics date range (which filters
+        # deleted_at: None for exactly this reason) are covered by
+        # (deleted_at, created_at) instead, and deleted_at-only queries use
+        # the (deleted_at, ...) compound prefixes.
         await db.orders.create_index("status", background=True)
-        await db.orders.create_index("created_at", background=True)
+        await db.orders.create_index([("user_id", 1), ("deleted_at", 1), ("created_at", -1), ("_id", -1)], background=True)
+        await db.orders.create_index([("deleted_at", 1), ("created_at", -1)], background=True)
         await db.orders.create_index([("deleted_at", 1), ("status", 1)], background=True)
         
-        # Categories indexes
-        await db.categories.create_index("deleted_at", background=True)
-        await db.categories.create_index("parent_id", background=True)
+        # Carts need no secondary index - documents are keyed by user id (_id)
+
+        # Favorites indexes - listing and toggling are user-scoped
+        await db.favorites.create_index([("user_id", 1), ("deleted_at", 1)], background=True)
+        await db.favorites.create_index([("user_id", 1), ("product_id", 1)], background=True)
         
-        # Car Brands indexes
-        await db.car_brands.create_index("deleted_at", background=True)
-        await db.car_brands.create_index("name", background=True)
+        # Comments indexes - product-scoped listing sorted by recency
+        await db.comments.create_index([("product_id", 1), ("deleted_at", 1), ("created_at", -1)], background=True)
         
-        # Car Models indexes
-        await db.car_models.create_index("deleted_at", background=True)
+        # Lookup tables: the (deleted_at, updated_at) sync indexes above double
+        # as the deleted_at-only index via their prefix, so no standalone one.
+        await db.categories.create_index("parent_id", background=True)
+        await db.car_brands.create_index("name", background=True)
         await db.car_models.create_index("brand_id", background=True)
         await db.car_models.create_index([("deleted_at", 1), ("brand_id", 1)], background=True)
         
         # Product Brands indexes
-        await db.product_brands.create_index("deleted_at", background=True)
         await db.product_brands.create_index("name", background=True)
         
         # Partners, Admins, Subscribers indexes
@@ -116,24 +173,69 @@ async def create_database_indexes():
         await db.subscribers.create_index("email", background=True)
         await db.subscribers.create_index("deleted_at", background=True)
         
-        # Notifications indexes
-        await db.notifications.create_index("user_id", background=True)
+        # Notifications indexes - (user_id, created_at) serves user_id-only
+        # queries through its prefix
         await db.notifications.create_index("created_at", background=True)
         await db.notifications.create_index([("user_id", 1), ("created_at", -1)], background=True)
         
         # Promotions indexes
+        # Partial index: marketing reads always filter is_active=True, so only
+        # active promotions need index entries. (A deleted_at partial filter is
+        # not usable here: {"deleted_at": None} also matches documents missing
+        # the field, which the planner cannot serve from a partial index.)
+        # Explicit name keeps the partial index distinct from the old plain
+        # is_active_1 dropped above, so the drop cannot hit the new index
         await db.promotions.create_index("deleted_at", background=True)
-        await db.promotions.create_index("is_active", background=True)
-        
+        await db.promotions.create_index(
+            "is_active",
+            name="is_active_true",
+            background=True,
+            partialFilterExpression={"is_active": True},
+        )
+
         # Bundle offers indexes
         await db.bundle_offers.create_index("deleted_at", background=True)
-        await db.bundle_offers.create_index("is_active", background=True)
+        await db.bundle_offers.create_index(
+            "is_active",
+            name="is_active_true",
+            background=True,
+            partialFilterExpression={"is_active": True},
+        )
         
         logger.info("Database indexes created successfully!")
         
     except Exception as e:
         logger.warning(f"Error creating some indexes: {e}")
 
+async def migrate_legacy_carts():
+    """
+    One-time re-key of cart documents created before carts were keyed by
+    user id: legacy docs carry a random _id plus a user_id field, which the
+    _id-based cart reads cannot see. Runs idempotently at startup and is a
+    no-op once no legacy documents remain.
+    """
+    try:
+        legacy = db.carts.find({
+            "user_id": {"$exists": True},
+            "$expr": {"$ne": ["$_id", "$user_id"]},
+        })
+        migrated = 0
+        async for cart in legacy:
+            legacy_id = cart["_id"]
+            user_id = cart["user_id"]
+            existing = await db.carts.find_one({"_id": user_id}, {"_id": 1})
+            if existing is None:
+                cart["_id"] = user_id
+                await db.carts.insert_one(cart)
+            # If a re-keyed cart already exists it is newer - keep it and
+            # just drop the legacy document
+            await db.carts.delete_one({"_id": legacy_id})
+            migrated += 1
+        if migrated:
+            logger.info(f"Re-keyed {migrated} legacy cart document(s) to _id=user_id")
+    except Exception as e:
+        logger.warning(f"Error migrating legacy carts: {e}")
+
 async def seed_database():
     """Seed initial data for the application"""
     from datetime import datetime, timezone
@@ -0,0 +1,25 @@
+"""
+Document ID Generation
+Time-ordered UUIDv7 string ids for hot insert paths
+"""
+import os
+import time
+import uuid
+
+
+def generate_uuid() -> str:
+    """
+    Generate a UUIDv7 (time-ordered) string id.
+
+    Random UUIDv4 ids scatter inserts across the whole _id index; the
+    millisecond-timestamp prefix of UUIDv7 keeps new documents appending to
+    the rightmost index pages, which matters for write-heavy collections
+    like orders, sessions and notifications.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    rand_a = int.from_bytes(os.urandom(2), "big") & 0x0FFF
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFFFFFFFFFFFFFF
+    value = (unix_ts_ms & 0xFFFFFFFFFFFF) << 80
+    value |= (0x7000 | rand_a) << 64
+    value |= 0x8000000000000000 | rand_b
+    return str(uuid.UUID(int=value))
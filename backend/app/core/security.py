@@ -1,6 +1,7 @@
 """
 Security and Authentication Helpers
 """
+import hashlib
 from fastapi import Request
 from datetime import datetime, timezone
 from .config import PRIMARY_OWNER_EMAIL
@@ -9,6 +10,11 @@ from .database import get_database
 def get_db():
     return get_database()
 
+def hash_session_token(token: str) -> str:
+    """SHA-256 fingerprint of a session token - sessions are indexed and
+    looked up by this fixed-width hash instead of the raw 200+ char token"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
 def serialize_doc(doc):
     """Convert MongoDB document to JSON-serializable format"""
     if doc is None:
@@ -35,7 +41,10 @@ async def get_current_user(request: Request):
     token = await get_session_token(request)
     if not token:
         return None
-    session = await db.sessions.find_one({"session_token": token})
+    session = await db.sessions.find_one({"token_hash": hash_session_token(token)})
+    if not session:
+        # Sessions created before the token_hash column existed
+        session = await db.sessions.find_one({"session_token": token})
     if not session:
         return None
     # Handle both timezone-aware and naive datetimes
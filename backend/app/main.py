@@ -14,7 +14,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from .core.database import connect_to_mongo, close_mongo_connection, create_database_indexes, seed_database, db
+from .core.database import connect_to_mongo, close_mongo_connection, create_database_indexes, migrate_legacy_carts, seed_database, db
 from .core.config import APP_VERSION
 from .api.v1 import api_router
 
@@ -29,6 +29,7 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting Al-Ghazaly Auto Parts API v{APP_VERSION} - Modular Architecture")
     database = await connect_to_mongo()
     await create_database_indexes()
+    await migrate_legacy_carts()
     
     # Seed initial data if needed
     existing_brands = await database.car_brands.count_documents({})
@@ -8,15 +8,15 @@ from typing import List, Optional, Dict, Any
 # ==================== Car & Product Schemas ====================
 
 class CarBrandCreate(BaseModel):
-    name: str
-    name_ar: str
+    name: str = Field(max_length=100)
+    name_ar: str = Field(max_length=100)
     logo: Optional[str] = None
-    distributor_id: Optional[str] = None
+    distributor_id: Optional[str] = Field(default=None, max_length=64)
 
 class CarModelCreate(BaseModel):
-    brand_id: str
-    name: str
-    name_ar: str
+    brand_id: str = Field(max_length=64)
+    name: str = Field(max_length=100)
+    name_ar: str = Field(max_length=100)
     year_start: Optional[int] = None
     year_end: Optional[int] = None
     image_url: Optional[str] = None
@@ -25,35 +25,35 @@ class CarModelCreate(BaseModel):
     variants: List[dict] = []
 
 class ProductBrandCreate(BaseModel):
-    name: str
-    name_ar: Optional[str] = None
+    name: str = Field(max_length=100)
+    name_ar: Optional[str] = Field(default=None, max_length=100)
     logo: Optional[str] = None
-    country_of_origin: Optional[str] = None
-    country_of_origin_ar: Optional[str] = None
-    supplier_id: Optional[str] = None
+    country_of_origin: Optional[str] = Field(default=None, max_length=100)
+    country_of_origin_ar: Optional[str] = Field(default=None, max_length=100)
+    supplier_id: Optional[str] = Field(default=None, max_length=64)
 
 class CategoryCreate(BaseModel):
-    name: str
-    name_ar: str
-    parent_id: Optional[str] = None
-    icon: Optional[str] = None
+    name: str = Field(max_length=100)
+    name_ar: str = Field(max_length=100)
+    parent_id: Optional[str] = Field(default=None, max_length=64)
+    icon: Optional[str] = Field(default=None, max_length=32)
     image_data: Optional[str] = None
 
 class ProductCreate(BaseModel):
-    name: str
-    name_ar: str
+    name: str = Field(max_length=200)
+    name_ar: str = Field(max_length=200)
     description: Optional[str] = None
     description_ar: Optional[str] = None
     price: float
-    sku: str
-    product_brand_id: Optional[str] = None
-    category_id: Optional[str] = None
+    sku: str = Field(max_length=64)
+    product_brand_id: Optional[str] = Field(default=None, max_length=64)
+    category_id: Optional[str] = Field(default=None, max_length=64)
     image_url: Optional[str] = None
     images: List[str] = []
     car_model_ids: List[str] = []
     stock_quantity: int = 0
     hidden_status: bool = False
-    added_by_admin_id: Optional[str] = None
+    added_by_admin_id: Optional[str] = Field(default=None, max_length=64)
 
 # ==================== Cart Schemas ====================
 
@@ -64,120 +64,120 @@ class DiscountDetails(BaseModel):
     discount_source_name: Optional[str] = None
 
 class CartItemAdd(BaseModel):
-    product_id: str
+    product_id: str = Field(max_length=64)
     quantity: int = 1
-    bundle_group_id: Optional[str] = None
-    bundle_offer_id: Optional[str] = None
+    bundle_group_id: Optional[str] = Field(default=None, max_length=64)
+    bundle_offer_id: Optional[str] = Field(default=None, max_length=64)
     bundle_discount_percentage: Optional[float] = None
 
 class CartItemAddEnhanced(BaseModel):
-    product_id: str
+    product_id: str = Field(max_length=64)
     quantity: int = 1
     original_unit_price: Optional[float] = None
     final_unit_price: Optional[float] = None
     discount_details: Optional[Dict[str, Any]] = None
-    bundle_group_id: Optional[str] = None
-    added_by_admin_id: Optional[str] = None
+    bundle_group_id: Optional[str] = Field(default=None, max_length=64)
+    added_by_admin_id: Optional[str] = Field(default=None, max_length=64)
 
 # ==================== Order Schemas ====================
 
 class OrderCreate(BaseModel):
-    first_name: str
-    last_name: str
-    email: str
-    phone: str
-    street_address: str
-    city: str
-    state: str
-    country: str = "Egypt"
-    delivery_instructions: Optional[str] = None
-    payment_method: str = "cash_on_delivery"
-    notes: Optional[str] = None
+    first_name: str = Field(max_length=100)
+    last_name: str = Field(max_length=100)
+    email: str = Field(max_length=254)
+    phone: str = Field(max_length=32)
+    street_address: str = Field(max_length=300)
+    city: str = Field(max_length=100)
+    state: str = Field(max_length=100)
+    country: str = Field(default="Egypt", max_length=100)
+    delivery_instructions: Optional[str] = Field(default=None, max_length=500)
+    payment_method: str = Field(default="cash_on_delivery", max_length=32)
+    notes: Optional[str] = Field(default=None, max_length=500)
 
 class AdminAssistedOrderCreate(BaseModel):
-    customer_id: str
+    customer_id: str = Field(max_length=64)
     items: List[Dict[str, Any]]
-    shipping_address: str
-    phone: str
+    shipping_address: str = Field(max_length=500)
+    phone: str = Field(max_length=32)
     notes: Optional[str] = None
 
 class AdminOrderCreate(BaseModel):
-    user_id: str
-    first_name: str
-    last_name: Optional[str] = ""
-    email: Optional[str] = ""
-    phone: str
-    street_address: str
-    city: str
-    state: Optional[str] = ""
-    country: Optional[str] = "Egypt"
-    delivery_instructions: Optional[str] = ""
-    payment_method: Optional[str] = "cash_on_delivery"
+    user_id: str = Field(max_length=64)
+    first_name: str = Field(max_length=100)
+    last_name: Optional[str] = Field(default="", max_length=100)
+    email: Optional[str] = Field(default="", max_length=254)
+    phone: str = Field(max_length=32)
+    street_address: str = Field(max_length=300)
+    city: str = Field(max_length=100)
+    state: Optional[str] = Field(default="", max_length=100)
+    country: Optional[str] = Field(default="Egypt", max_length=100)
+    delivery_instructions: Optional[str] = Field(default="", max_length=500)
+    payment_method: Optional[str] = Field(default="cash_on_delivery", max_length=32)
     notes: Optional[str] = ""
     items: List[dict]
 
 # ==================== User & Admin Schemas ====================
 
 class CommentCreate(BaseModel):
-    text: str
+    text: str = Field(max_length=2000)
     rating: Optional[int] = None
 
 class FavoriteAdd(BaseModel):
-    product_id: str
+    product_id: str = Field(max_length=64)
 
 class PartnerCreate(BaseModel):
-    email: str
+    email: str = Field(max_length=254)
 
 class AdminCreate(BaseModel):
-    email: str
-    name: Optional[str] = None
+    email: str = Field(max_length=254)
+    name: Optional[str] = Field(default=None, max_length=100)
 
 class SupplierCreate(BaseModel):
-    name: str
-    name_ar: Optional[str] = None
+    name: str = Field(max_length=200)
+    name_ar: Optional[str] = Field(default=None, max_length=200)
     profile_image: Optional[str] = None
     phone_numbers: List[str] = []
-    address: Optional[str] = None
-    address_ar: Optional[str] = None
+    address: Optional[str] = Field(default=None, max_length=300)
+    address_ar: Optional[str] = Field(default=None, max_length=300)
     description: Optional[str] = None
     description_ar: Optional[str] = None
     slider_images: List[str] = []
-    website_url: Optional[str] = None
+    website_url: Optional[str] = Field(default=None, max_length=300)
     linked_product_brand_ids: List[str] = []
 
 class DistributorCreate(BaseModel):
-    name: str
-    name_ar: Optional[str] = None
+    name: str = Field(max_length=200)
+    name_ar: Optional[str] = Field(default=None, max_length=200)
     profile_image: Optional[str] = None
     phone_numbers: List[str] = []
-    address: Optional[str] = None
-    address_ar: Optional[str] = None
+    address: Optional[str] = Field(default=None, max_length=300)
+    address_ar: Optional[str] = Field(default=None, max_length=300)
     description: Optional[str] = None
     description_ar: Optional[str] = None
     slider_images: List[str] = []
-    website_url: Optional[str] = None
+    website_url: Optional[str] = Field(default=None, max_length=300)
     linked_car_brand_ids: List[str] = []
 
 class SubscriberCreate(BaseModel):
-    email: str
+    email: str = Field(max_length=254)
 
 class SubscriptionRequestCreate(BaseModel):
-    customer_name: str
-    phone: str
-    governorate: str
-    village: str
-    address: str
-    car_model: str
+    customer_name: str = Field(max_length=100)
+    phone: str = Field(max_length=32)
+    governorate: str = Field(max_length=100)
+    village: str = Field(max_length=100)
+    address: str = Field(max_length=300)
+    car_model: str = Field(max_length=100)
     description: Optional[str] = None
 
 class NotificationCreate(BaseModel):
-    user_id: str
-    title: str
-    message: str
-    type: str = "info"
+    user_id: str = Field(max_length=64)
+    title: str = Field(max_length=200)
+    message: str = Field(max_length=1000)
+    type: str = Field(default="info", max_length=32)
 
 class SettleRevenueRequest(BaseModel):
-    admin_id: str
+    admin_id: str = Field(max_length=64)
     product_ids: List[str]
     total_amount: float
 
@@ -190,22 +190,22 @@ class SyncPullRequest(BaseModel):
 # ==================== Marketing Schemas ====================
 
 class PromotionCreate(BaseModel):
-    title: str
-    title_ar: Optional[str] = None
+    title: str = Field(max_length=200)
+    title_ar: Optional[str] = Field(default=None, max_length=200)
     image: Optional[str] = None
-    promotion_type: str = "slider"
+    promotion_type: str = Field(default="slider", max_length=32)
     is_active: bool = True
-    target_product_id: Optional[str] = None
-    target_car_model_id: Optional[str] = None
+    target_product_id: Optional[str] = Field(default=None, max_length=64)
+    target_car_model_id: Optional[str] = Field(default=None, max_length=64)
     sort_order: int = 0
 
 class BundleOfferCreate(BaseModel):
-    name: str
-    name_ar: Optional[str] = None
+    name: str = Field(max_length=200)
+    name_ar: Optional[str] = Field(default=None, max_length=200)
     description: Optional[str] = None
     description_ar: Optional[str] = None
     discount_percentage: float
-    target_car_model_id: Optional[str] = None
+    target_car_model_id: Optional[str] = Field(default=None, max_length=64)
     product_ids: List[str] = []
     image: Optional[str] = None
     is_active: bool = True
@@ -6,9 +6,9 @@ Supports:
 - Admin activity notifications (owner/partner/admin only)
 """
 from datetime import datetime, timezone
-import uuid
 from typing import Optional, List
 from ..core.database import db
+from ..core.ids import generate_uuid
 from ..core.security import serialize_doc
 from .websocket import manager
 
@@ -58,16 +58,16 @@ ORDER_STATUS_MESSAGES = {
 }
 
 
-async def create_notification(
-    user_id: str, 
-    title: str, 
-    message: str, 
-    notif_type: str = "info", 
+def build_notification(
+    user_id: str,
+    title: str,
+    message: str,
+    notif_type: str = "info",
     extra_data: dict = None
 ):
-    """Create and broadcast a notification to a specific user"""
+    """Build a notification document without persisting it"""
     notification = {
-        "_id": str(uuid.uuid4()),
+        "_id": generate_uuid(),
         "user_id": user_id,
         "title": title,
         "message": message,
@@ -77,11 +77,34 @@ async def create_notification(
     }
     if extra_data:
         notification.update(extra_data)
+    return notification
+
+
+async def create_notification(
+    user_id: str, 
+    title: str, 
+    message: str, 
+    notif_type: str = "info", 
+    extra_data: dict = None
+):
+    """Create and broadcast a notification to a specific user"""
+    notification = build_notification(user_id, title, message, notif_type, extra_data)
     await db.notifications.insert_one(notification)
     await manager.send_notification(user_id, serialize_doc(notification))
     return notification
 
 
+async def create_notifications_bulk(notifications: List[dict]):
+    """Persist a fan-out batch with one insert_many round trip, then push
+    each notification over the websocket manager"""
+    if not notifications:
+        return notifications
+    await db.notifications.insert_many(notifications)
+    for notification in notifications:
+        await manager.send_notification(notification["user_id"], serialize_doc(notification))
+    return notifications
+
+
 async def create_order_status_notification(
     user_id: str,
     order_number: str,
@@ -149,7 +172,7 @@ async def create_promotional_notification(
     Used for new promotions and bundle offers.
     """
     # Get all active users
-    all_users = await db.users.find({"deleted_at": None}).to_list(10000)
+    all_users = await db.users.find({"deleted_at": None}, {"preferred_language": 1}).to_list(10000)
     
     notifications_created = []
     
@@ -172,16 +195,15 @@ async def create_promotional_notification(
         if bundle_id:
             extra_data["bundle_id"] = bundle_id
         
-        notification = await create_notification(
+        notifications_created.append(build_notification(
             user_id=user_id,
             title=localized_title,
             message=localized_message,
             notif_type="promo",
             extra_data=extra_data
-        )
-        notifications_created.append(notification)
+        ))
     
-    return notifications_created
+    return await create_notifications_bulk(notifications_created)
 
 
 async def create_admin_activity_notification(
@@ -205,7 +227,7 @@ async def create_admin_activity_notification(
     admin_users = await db.users.find({
         "role": {"$in": admin_roles},
         "deleted_at": None
-    }).to_list(1000)
+    }, {"preferred_language": 1}).to_list(1000)
     
     notifications_created = []
     
@@ -224,16 +246,15 @@ async def create_admin_activity_notification(
         if extra_data:
             notification_extra.update(extra_data)
         
-        notification = await create_notification(
+        notifications_created.append(build_notification(
             user_id=user_id,
             title=localized_title,
             message=localized_message,
             notif_type="admin",
             extra_data=notification_extra
-        )
-        notifications_created.append(notification)
+        ))
     
-    return notifications_created
+    return await create_notifications_bulk(notifications_created)
 
 
 # Convenience functions for specific admin activities